@@ -1,26 +1,46 @@
 import os
+import json
+import time
 import random
 import asyncio
 import logging
+import heapq
+import collections
 import contextvars
 from datetime import datetime
 from typing import Optional
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from dotenv import load_dotenv
 
 # Load environment variables from a .env file if present
 load_dotenv()
 
 TOKEN = os.getenv("DISCORD_TOKEN")
-GUILD_WELCOME_CHANNEL_ID = os.getenv("WELCOME_CHANNEL_ID")  # optional override
+_welcome_channel_env = os.getenv("WELCOME_CHANNEL_ID")  # optional override
+GUILD_WELCOME_CHANNEL_ID = int(_welcome_channel_env) if _welcome_channel_env else None
 CATEGORY_ID_FOR_WHAT = int(os.getenv("WHAT_CATEGORY_ID", "1373594566997053472"))
 PHOTOS_DIR = os.getenv("PHOTOS_DIR", "photos")
 BOT_PREFIX = os.getenv("BOT_PREFIX", "!")
 RULES_CHANNEL_ID = int(os.getenv("RULES_CHANNEL_ID", "1373596179203489812"))  # rules channel
 MOD_RELAY_CHANNEL_ID = int(os.getenv("MOD_RELAY_CHANNEL_ID", "1409855949560221818"))  # channel where DMs are forwarded for mods
 
+# Welcome message parts around the member mention; none of this changes at runtime
+_WELCOME_PREFIX = "**Welcome to the server "
+_WELCOME_SUFFIX = (
+    f"! 🎉**\n"
+    f"Please read the <#{RULES_CHANNEL_ID}> before you start chatting in this server.\n\n"
+    "If you have any questions, feel free to ask Josh or any of the moderators (or anyone else, I think most people here would be happy to answer your questions 😁)\n\n"
+    f"Wanna know what *I* can do? Just type `{BOT_PREFIX}help` in chat!"
+)
+
+# Keyword -> reply URL for messages inside the "what" category
+_CATEGORY_REPLIES = {
+    "what": "https://i.ibb.co/ccKSZKwj/image.png",
+    "crazy": "https://i.ibb.co/9k8tmgm0/image0.jpg",
+}
+
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True  # required for member join events
@@ -30,18 +50,34 @@ logger = logging.getLogger("picl")
 
 # Per-command log capture structures
 _current_command_log: contextvars.ContextVar[list] = contextvars.ContextVar("current_command_log", default=None)  # type: ignore[arg-type]
-_logs_by_message: dict[int, str] = {}
-_relay_message_map: dict[int, int] = {}  # forwarded message id -> user id
+_active_captures = 0  # commands currently capturing; lets emit() bail before touching the ContextVar
+_logs_by_message: collections.OrderedDict[int, str] = collections.OrderedDict()
+_relay_message_map: collections.OrderedDict[int, int] = collections.OrderedDict()  # forwarded message id -> user id
+_LOGS_BY_MESSAGE_MAX = 500  # ~8KB per entry worst case, so ~4MB bound
+_RELAY_MESSAGE_MAP_MAX = 2000
+_what_channels: frozenset[int] = frozenset()  # channel IDs inside CATEGORY_ID_FOR_WHAT
+_welcome_channel_by_guild: dict[int, discord.TextChannel] = {}  # fallback welcome channel per guild
 _active_senders: set[int] = set()  # user IDs who have spoken in guild text channels
+_active_senders_dirty = False  # set when _active_senders changed since last flush
+_inactivity_heap: list[tuple[float, int]] = []  # (kick deadline ts, member id), min-heap
 _inactivity_task_started = False
 
+IMAGE_EXTS = frozenset({"png", "jpg", "jpeg", "gif", "webp"})  # lowercase, without the dot
+PHOTO_CACHE_TTL_SECONDS = 60.0
+_photo_cache: tuple[float, float, list[str]] | None = None  # (dir mtime, cached_at, files)
+
 INACTIVE_KICK_DAYS = int(os.getenv("INACTIVE_KICK_DAYS", "7"))
 INACTIVE_CHECK_INTERVAL_SECONDS = int(os.getenv("INACTIVE_CHECK_INTERVAL_SECONDS", str(3600)))  # 1h default
+KICK_CONCURRENCY = int(os.getenv("KICK_CONCURRENCY", "5"))  # kicks in flight at once
 CHANNEL_HISTORY_SAMPLING_LIMIT = int(os.getenv("CHANNEL_HISTORY_SAMPLING_LIMIT", "200"))  # per channel on startup
+ACTIVE_SENDERS_FILE = os.getenv("ACTIVE_SENDERS_FILE", "active_senders.json")
+ACTIVE_SENDERS_FLUSH_INTERVAL_SECONDS = int(os.getenv("ACTIVE_SENDERS_FLUSH_INTERVAL_SECONDS", "60"))
 
 
 class _BufferLogHandler(logging.Handler):
     def emit(self, record: logging.LogRecord):
+        if _active_captures == 0:
+            return
         buf = _current_command_log.get()
         if buf is not None:
             try:
@@ -59,77 +95,151 @@ logger.propagate = True
 bot = commands.Bot(command_prefix=BOT_PREFIX, intents=intents, help_command=None)
 
 
+def _rebuild_what_channels():
+    global _what_channels
+    _what_channels = frozenset(
+        channel.id
+        for guild in bot.guilds
+        for channel in guild.channels
+        if getattr(channel, "category_id", None) == CATEGORY_ID_FOR_WHAT
+    )
+
+
+def _rebuild_welcome_channels():
+    _welcome_channel_by_guild.clear()
+    for guild in bot.guilds:
+        if guild.me is None:
+            continue
+        for channel in guild.text_channels:
+            if channel.permissions_for(guild.me).send_messages:
+                _welcome_channel_by_guild[guild.id] = channel
+                break
+
+
+@bot.event
+async def on_guild_channel_create(channel: discord.abc.GuildChannel):
+    _rebuild_what_channels()
+    _rebuild_welcome_channels()
+
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    _rebuild_what_channels()
+    _rebuild_welcome_channels()
+
+
+@bot.event
+async def on_guild_channel_update(before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+    _rebuild_what_channels()
+    _rebuild_welcome_channels()
+
+
+@bot.event
+async def on_guild_role_update(before: discord.Role, after: discord.Role):
+    _rebuild_welcome_channels()
+
+
 @bot.event
 async def on_ready():
     print(f"Picl is online as {bot.user} (ID: {bot.user.id})")
+    _rebuild_what_channels()
+    _rebuild_welcome_channels()
     # Start inactivity task once per process
     global _inactivity_task_started
     if not _inactivity_task_started:
         _inactivity_task_started = True
         bot.loop.create_task(_populate_active_senders_initial())
-        bot.loop.create_task(_inactivity_enforcement_loop())
+        _inactivity_task.start()
+        bot.loop.create_task(_active_senders_flush_loop())
 
 
 @bot.event
 async def on_member_join(member: discord.Member):
+    # Arm the inactivity deadline for the new member
+    if not member.bot:
+        joined_ts = (member.joined_at or discord.utils.utcnow()).timestamp()
+        heapq.heappush(_inactivity_heap, (joined_ts + INACTIVE_KICK_DAYS * 86400, member.id))
     # Try a specified welcome channel first
     channel: Optional[discord.TextChannel] = None
     if GUILD_WELCOME_CHANNEL_ID:
-        try:
-            channel = await bot.fetch_channel(int(GUILD_WELCOME_CHANNEL_ID))  # type: ignore[arg-type]
-        except Exception:
-            channel = None
-    # Fallback: first text channel the bot can send messages to
+        channel = bot.get_channel(GUILD_WELCOME_CHANNEL_ID)  # type: ignore[assignment]
+        if channel is None:
+            try:
+                channel = await bot.fetch_channel(GUILD_WELCOME_CHANNEL_ID)  # type: ignore[assignment]
+            except Exception:
+                channel = None
+    # Fallback: cached first text channel the bot can send messages to
+    if channel is None:
+        channel = _welcome_channel_by_guild.get(member.guild.id)
     if channel is None:
         for c in member.guild.text_channels:
             if c.permissions_for(member.guild.me).send_messages:  # type: ignore[union-attr]
                 channel = c
+                _welcome_channel_by_guild[member.guild.id] = c
                 break
-    welcome_text = (
-        f"**Welcome to the server {member.mention}! 🎉**\n"
-        f"Please read the <#{RULES_CHANNEL_ID}> before you start chatting in this server.\n\n"
-        "If you have any questions, feel free to ask Josh or any of the moderators (or anyone else, I think most people here would be happy to answer your questions 😁)\n\n"
-        f"Wanna know what *I* can do? Just type `{BOT_PREFIX}help` in chat!"
-    )
-    if channel:
+    welcome_text = _WELCOME_PREFIX + member.mention + _WELCOME_SUFFIX
+
+    async def _send_to_channel():
+        if channel:
+            try:
+                await channel.send(welcome_text)
+            except discord.Forbidden:
+                pass
+
+    async def _send_dm():
+        # Also DM the user (ignore if they have DMs closed)
         try:
-            await channel.send(welcome_text)
-        except discord.Forbidden:
+            await member.send(welcome_text)
+        except discord.HTTPException:
             pass
-    # Also DM the user (ignore if they have DMs closed)
-    try:
-        await member.send(welcome_text)
-    except discord.HTTPException:
-        pass
+
+    await asyncio.gather(_send_to_channel(), _send_dm())
 
 
 def _start_command_log():
+    global _active_captures
     lst: list = []
     token = _current_command_log.set(lst)
+    _active_captures += 1
     return lst, token
 
 
 def _end_command_log(token, message: discord.Message | None = None):
+    global _active_captures
     try:
         buf = _current_command_log.get()
     finally:
         _current_command_log.reset(token)
+        _active_captures -= 1
     if message and buf:
         joined = "\n".join(buf)
         if len(joined) > 8000:
             joined = joined[-8000:]
         _logs_by_message[message.id] = joined
+        _logs_by_message.move_to_end(message.id)
+        while len(_logs_by_message) > _LOGS_BY_MESSAGE_MAX:
+            _logs_by_message.popitem(last=False)
 
 
 @bot.event
 async def on_message(message: discord.Message):
     if message.author.bot:
         return
-    content_lower = message.content.lower().strip()
+    raw = message.content
+    # Only short keywords ("what", "crazy", "!log") are matched against the
+    # lowered form; skip the string allocations for ordinary chat messages.
+    if len(raw) <= 8 or raw.startswith("!"):
+        content_lower = raw.lower().strip()
+    else:
+        content_lower = ""
 
     # Track active sender for guild messages only
     if message.guild is not None:
-        _active_senders.add(message.author.id)
+        author_id = message.author.id
+        if author_id not in _active_senders:
+            _active_senders.add(author_id)
+            global _active_senders_dirty
+            _active_senders_dirty = True
 
     # --- DM Relay: user -> mods ---
     if message.guild is None:
@@ -157,6 +267,9 @@ async def on_message(message: discord.Message):
                 try:
                     fwd_msg = await relay_channel.send(embed=embed)
                     _relay_message_map[fwd_msg.id] = message.author.id
+                    _relay_message_map.move_to_end(fwd_msg.id)
+                    while len(_relay_message_map) > _RELAY_MESSAGE_MAP_MAX:
+                        _relay_message_map.popitem(last=False)
                 except discord.HTTPException:
                     pass
         # Still allow commands in DMs
@@ -181,13 +294,11 @@ async def on_message(message: discord.Message):
             if len(msg_body) > 1900:
                 msg_body = msg_body[:1900] + "…"
             try:
-                files = []
-                for a in message.attachments[:5]:
-                    try:
-                        fp = await a.to_file()
-                        files.append(fp)
-                    except Exception:
-                        pass
+                results = await asyncio.gather(
+                    *(a.to_file() for a in message.attachments[:5]),
+                    return_exceptions=True,
+                )
+                files = [r for r in results if not isinstance(r, BaseException)]
                 await user.send(f"**Moderator Reply:**\n{msg_body}", files=files or None)
                 # Reaction acknowledgment
                 try:
@@ -200,27 +311,15 @@ async def on_message(message: discord.Message):
                 except discord.HTTPException:
                     pass
 
-    # Feature: respond to 'what' in category (only if guild & category match)
-    if (
-        content_lower == "what"
-        and message.guild is not None
-        and getattr(message.channel, "category_id", None) == CATEGORY_ID_FOR_WHAT
-    ):
-        try:
-            await message.reply("https://i.ibb.co/ccKSZKwj/image.png")
-        except discord.HTTPException:
-            pass
-    
-    # Feature: respond to 'crazy' in category (only if guild & category match)
-    if (
-        content_lower == "crazy"
-        and message.guild is not None
-        and getattr(message.channel, "category_id", None) == CATEGORY_ID_FOR_WHAT
-    ):
-        try:
-            await message.reply("https://i.ibb.co/9k8tmgm0/image0.jpg")
-        except discord.HTTPException:
-            pass
+    # Feature: keyword replies in the configured category; check the channel
+    # first so messages everywhere else cost a single set lookup
+    if message.channel.id in _what_channels:
+        reply_url = _CATEGORY_REPLIES.get(content_lower)
+        if reply_url:
+            try:
+                await message.reply(reply_url)
+            except discord.HTTPException:
+                pass
 
     # Reply with !log to a bot message to retrieve its captured log
     if content_lower == "!log" and message.reference and message.reference.message_id:
@@ -230,16 +329,54 @@ async def on_message(message: discord.Message):
             if not log_text:
                 await message.reply("No log recorded.")
             else:
-                for chunk in _chunk(log_text):
-                    try:
-                        await message.reply(f"```log\n{chunk}\n```")
-                    except discord.HTTPException:
-                        break
+                # Leave room for the ```log fence so chunks never split it
+                chunks = list(_chunk(log_text, size=1890))
+                await asyncio.gather(
+                    *(message.reply(f"```log\n{chunk}\n```") for chunk in chunks),
+                    return_exceptions=True,
+                )
         return  # don't treat !log as a command
 
     await bot.process_commands(message)
 
 
+def _pick_photo() -> tuple[Optional[str], int]:
+    """Pick a random image from PHOTOS_DIR; returns (path or None, candidate count).
+
+    Blocking disk I/O — run via asyncio.to_thread. Raises FileNotFoundError if
+    the photos directory is missing.
+    """
+    global _photo_cache
+    if not os.path.isdir(PHOTOS_DIR):
+        raise FileNotFoundError(PHOTOS_DIR)
+    dir_mtime = os.stat(PHOTOS_DIR).st_mtime
+    now = time.monotonic()
+    if (
+        _photo_cache is not None
+        and _photo_cache[0] == dir_mtime
+        and now - _photo_cache[1] < PHOTO_CACHE_TTL_SECONDS
+    ):
+        files = _photo_cache[2]
+        logger.info("Using cached photo listing (%d images)", len(files))
+        return (random.choice(files) if files else None, len(files))
+    chosen = None
+    n = 0
+    files = []
+    with os.scandir(PHOTOS_DIR) as it:
+        for entry in it:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if entry.name.rpartition(".")[2].lower() not in IMAGE_EXTS:
+                continue
+            files.append(entry.path)
+            n += 1
+            # Reservoir sampling (k=1): entry i survives with probability 1/i
+            if random.random() * n < 1.0:
+                chosen = entry.path
+    _photo_cache = (dir_mtime, now, files)
+    return chosen, n
+
+
 @bot.command(name="picl")
 async def picl_command(ctx: commands.Context):
     """Send a random photo from the photos directory."""
@@ -247,26 +384,21 @@ async def picl_command(ctx: commands.Context):
     message_obj: discord.Message | None = None
     logger.info("picl command invoked by %s (%s)", ctx.author, ctx.author.id)
     try:
-        if not os.path.isdir(PHOTOS_DIR):
+        # Keep the disk I/O off the event loop so other handlers stay responsive
+        try:
+            chosen, n = await asyncio.to_thread(_pick_photo)
+        except FileNotFoundError:
             logger.warning("Photos directory '%s' missing", PHOTOS_DIR)
             message_obj = await ctx.send("Photos directory not found.")
             return
-
-        exts = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
-        files = [
-            os.path.join(PHOTOS_DIR, f)
-            for f in os.listdir(PHOTOS_DIR)
-            if os.path.isfile(os.path.join(PHOTOS_DIR, f)) and os.path.splitext(f)[1].lower() in exts
-        ]
-        logger.info("Found %d candidate images", len(files))
-        if not files:
+        logger.info("Found %d candidate images", n)
+        if chosen is None:
             message_obj = await ctx.send("No images available.")
             return
 
-        chosen = random.choice(files)
         logger.info("Chosen image: %s", chosen)
         try:
-            size = os.path.getsize(chosen)
+            size = await asyncio.to_thread(os.path.getsize, chosen)
             logger.info("Image size: %d bytes", size)
             if size == 0:
                 message_obj = await ctx.send("Image file is empty, skipping.")
@@ -277,7 +409,7 @@ async def picl_command(ctx: commands.Context):
             return
 
         try:
-            file = discord.File(fp=chosen, filename=os.path.basename(chosen))
+            file = await asyncio.to_thread(discord.File, chosen, filename=os.path.basename(chosen))
             message_obj = await ctx.send(content=f"Here's your picl: {os.path.basename(chosen)}", file=file)
             logger.info("Image sent successfully (message id %s)", message_obj.id)
         except (discord.HTTPException, OSError):
@@ -312,42 +444,47 @@ async def on_command_error(ctx: commands.Context, error: Exception):
         pass
 
 
+# Help output never depends on the invocation context, so build it once
+_HELP_EMBED = discord.Embed(
+    title="Help",
+    description="meow",
+    color=0x2ECC71,
+)
+_HELP_EMBED.add_field(
+    name=f"{BOT_PREFIX}picl",
+    value="gives you a picl photo",
+    inline=False,
+)
+_HELP_EMBED.add_field(
+    name="what",
+    value="dawg",
+    inline=False,
+)
+_HELP_EMBED.add_field(
+    name="crazy",
+    value="i was crazy once",
+    inline=False,
+)
+_HELP_EMBED.set_footer(text="picl • made by joshatticus")
+
+_HELP_FALLBACK = "\n".join(
+    [
+        "Picl Help:",
+        f"{BOT_PREFIX}picl - gives you a picl photo",
+        "what - dawg",
+    ]
+)
+
+
 @bot.command(name="help")
 async def help_command(ctx: commands.Context):
     """Display help information for Picl."""
-    prefix = BOT_PREFIX
-    embed = discord.Embed(
-        title="Help",
-        description="meow",
-        color=0x2ECC71,
-    )
-    embed.add_field(
-        name=f"{prefix}picl",
-        value="gives you a picl photo",
-        inline=False,
-    )
-    embed.add_field(
-        name="what",
-        value="dawg",
-        inline=False,
-    )
-    embed.add_field(
-        name="crazy",
-        value="i was crazy once",
-        inline=False,
-    )
-    embed.set_footer(text="picl • made by joshatticus")
     try:
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_HELP_EMBED)
     except discord.HTTPException:
         # Fallback plain text
-        lines = [
-            "Picl Help:",
-            f"{prefix}picl - gives you a picl photo",
-            "what - dawg",
-        ]
         try:
-            await ctx.send("\n".join(lines))
+            await ctx.send(_HELP_FALLBACK)
         except discord.HTTPException:
             pass
 
@@ -355,25 +492,76 @@ async def help_command(ctx: commands.Context):
 def main():
     if not TOKEN:
         raise SystemExit("DISCORD_TOKEN not set. Put it in a .env file or env var.")
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass  # optional; falls back to the default event loop (e.g. on Windows)
     bot.run(TOKEN)
 
 
 # ---------------- Inactivity Enforcement ---------------- #
 
+def _load_active_senders() -> bool:
+    """Load the persisted active-sender set; returns True if anything was loaded."""
+    try:
+        with open(ACTIVE_SENDERS_FILE, "r", encoding="utf-8") as fh:
+            ids = json.load(fh)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(ids, list):
+        return False
+    _active_senders.update(int(i) for i in ids)
+    return bool(_active_senders)
+
+
+def _save_active_senders():
+    tmp_path = ACTIVE_SENDERS_FILE + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(sorted(_active_senders), fh)
+        os.replace(tmp_path, ACTIVE_SENDERS_FILE)
+    except OSError:
+        logger.exception("Failed to persist active senders to %s", ACTIVE_SENDERS_FILE)
+
+
+async def _active_senders_flush_loop():
+    """Write the active-sender set to disk periodically, only when it changed."""
+    global _active_senders_dirty
+    await bot.wait_until_ready()
+    while not bot.is_closed():
+        await asyncio.sleep(ACTIVE_SENDERS_FLUSH_INTERVAL_SECONDS)
+        if _active_senders_dirty:
+            _active_senders_dirty = False
+            _save_active_senders()
+
+
 async def _populate_active_senders_initial():
     """Sample recent channel history to avoid false positives after a restart.
 
-    We scan a limited number of messages per text channel (configurable) to mark users
-    who have previously spoken so they aren't kicked incorrectly.
+    The set is persisted to ACTIVE_SENDERS_FILE, so if a previous run left one
+    behind we reuse it and skip the (expensive) history pagination entirely.
+    Otherwise we scan a limited number of messages per text channel (configurable)
+    to mark users who have previously spoken so they aren't kicked incorrectly.
     """
+    global _active_senders_dirty
     await bot.wait_until_ready()
+    if _load_active_senders():
+        logger.info(
+            "Loaded %d active senders from %s; skipping history sampling",
+            len(_active_senders),
+            ACTIVE_SENDERS_FILE,
+        )
+        return
     if not bot.guilds:
         return
     guild = bot.guilds[0]
     logger.info("Sampling recent history in %s for active senders", guild.name)
-    for channel in guild.text_channels:
+
+    async def _scan(channel: discord.TextChannel):
         if not channel.permissions_for(guild.me).read_message_history:  # type: ignore
-            continue
+            return
         try:
             async for msg in channel.history(limit=CHANNEL_HISTORY_SAMPLING_LIMIT, oldest_first=False):
                 if msg.author.bot:
@@ -381,60 +569,106 @@ async def _populate_active_senders_initial():
                 _active_senders.add(msg.author.id)
         except Exception:
             # Ignore history fetch errors / missing perms
-            continue
+            pass
+
+    await asyncio.gather(*(_scan(channel) for channel in guild.text_channels))
     logger.info("Active sender sample size: %d", len(_active_senders))
+    _active_senders_dirty = True
+
+
+def _seed_inactivity_heap():
+    """Push a kick deadline for every current non-bot member.
+
+    Entries for members who have spoken or left are skipped lazily when popped,
+    so seeding doesn't need to know the final active-sender set.
+    """
+    if not bot.guilds:
+        return
+    offset = INACTIVE_KICK_DAYS * 86400
+    for member in bot.guilds[0].members:
+        if member.bot or member.joined_at is None:
+            continue
+        heapq.heappush(_inactivity_heap, (member.joined_at.timestamp() + offset, member.id))
+
+
+@tasks.loop(seconds=INACTIVE_CHECK_INTERVAL_SECONDS)
+async def _inactivity_task():
+    delay = INACTIVE_CHECK_INTERVAL_SECONDS
+    try:
+        delay = await _run_inactivity_check()
+    except Exception:
+        logger.exception("Inactivity enforcement loop iteration failed")
+    # Sleep until the next deadline instead of a fixed interval
+    _inactivity_task.change_interval(seconds=delay)
 
 
-async def _inactivity_enforcement_loop():
+@_inactivity_task.before_loop
+async def _inactivity_task_before():
     await bot.wait_until_ready()
-    while not bot.is_closed():
-        try:
-            await _run_inactivity_check()
-        except Exception:
-            logger.exception("Inactivity enforcement loop iteration failed")
-        await asyncio.sleep(INACTIVE_CHECK_INTERVAL_SECONDS)
+    _seed_inactivity_heap()
+
 
+async def _run_inactivity_check() -> float:
+    """Kick members whose deadline has passed; return seconds until the next one.
 
-async def _run_inactivity_check():
+    The sleep hint is capped at INACTIVE_CHECK_INTERVAL_SECONDS so the loop
+    still wakes periodically even with an empty or far-future heap.
+    """
     if not bot.guilds:
-        return
+        return INACTIVE_CHECK_INTERVAL_SECONDS
     guild = bot.guilds[0]
     if not guild.me.guild_permissions.kick_members:  # type: ignore
         logger.debug("Skipping inactivity check: missing kick_members permission")
-        return
-    now = discord.utils.utcnow()
-    threshold = now.timestamp() - (INACTIVE_KICK_DAYS * 86400)
+        return INACTIVE_CHECK_INTERVAL_SECONDS
+    now = discord.utils.utcnow().timestamp()
+    offset = INACTIVE_KICK_DAYS * 86400
     to_kick: list[discord.Member] = []
-    for member in guild.members:
-        if member.bot:
+    while _inactivity_heap and _inactivity_heap[0][0] <= now:
+        _, member_id = heapq.heappop(_inactivity_heap)
+        # If they have spoken we skip (lazy removal from the heap)
+        if member_id in _active_senders:
             continue
-        # If they have spoken we skip
-        if member.id in _active_senders:
-            continue
-        joined_at = member.joined_at
-        if not joined_at:
-            continue
-        if joined_at.timestamp() <= threshold:
-            to_kick.append(member)
+        member = guild.get_member(member_id)
+        if member is None or member.bot:
+            continue  # left the guild since the entry was pushed
+        if member.joined_at is not None:
+            deadline = member.joined_at.timestamp() + offset
+            if deadline > now:
+                # Rejoined since the stale entry was pushed; re-arm
+                heapq.heappush(_inactivity_heap, (deadline, member_id))
+                continue
+        to_kick.append(member)
+
+    def _next_delay() -> float:
+        if _inactivity_heap:
+            return max(1.0, min(_inactivity_heap[0][0] - now, INACTIVE_CHECK_INTERVAL_SECONDS))
+        return INACTIVE_CHECK_INTERVAL_SECONDS
+
     if not to_kick:
-        return
+        return _next_delay()
     logger.info("Found %d inactive silent members to kick", len(to_kick))
-    for member in to_kick:
-        dm_text = (
-            "You've joined our server but haven't said anything yet. To prevent message scraping bots, "
-            "we've kicked you from the server. Feel free to rejoin at a later time."
-        )
-        try:
+    dm_text = (
+        "You've joined our server but haven't said anything yet. To prevent message scraping bots, "
+        "we've kicked you from the server. Feel free to rejoin at a later time."
+    )
+    sem = asyncio.Semaphore(KICK_CONCURRENCY)
+
+    async def _kick_one(member: discord.Member):
+        async with sem:
             try:
-                await member.send(dm_text)
+                try:
+                    await member.send(dm_text)
+                except discord.HTTPException:
+                    pass
+                await guild.kick(member, reason="Possible message scraping bot; no messages for 7 days")
+                logger.info("Kicked inactive member %s (%s)", member, member.id)
+            except discord.Forbidden:
+                logger.warning("Forbidden kicking %s", member)
             except discord.HTTPException:
-                pass
-            await guild.kick(member, reason="Possible message scraping bot; no messages for 7 days")
-            logger.info("Kicked inactive member %s (%s)", member, member.id)
-        except discord.Forbidden:
-            logger.warning("Forbidden kicking %s", member)
-        except discord.HTTPException:
-            logger.exception("HTTPException kicking %s", member)
+                logger.exception("HTTPException kicking %s", member)
+
+    await asyncio.gather(*(_kick_one(member) for member in to_kick))
+    return _next_delay()
 
 
 if __name__ == "__main__":